@@ -46,6 +46,9 @@ if (Test-Path $settingsFile) {
 }
 
 if ($isInstalled) {
+    # Dependencies were checked at install time, so tag_verifier.py can skip its own check
+    $env:CHECK_ID3_SKIP_DEPS = '1'
+
     # Add variables to store last used paths and modes
     $lastTagsPath = $null
     $lastFolderPath = $null
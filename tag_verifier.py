@@ -3,13 +3,19 @@ import csv
 import argparse
 import subprocess
 import sys
-from pathlib import Path
 import re  # Add this at the top with other imports
 import io
+import itertools
 import datetime
+import hashlib
+import json
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 
 # Ensure Unicode output works in Windows console
-if sys.platform == 'win32':
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() != 'utf-8':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
@@ -38,13 +44,11 @@ def check_dependencies():
             print(f"pip install {' '.join(REQUIRED_PACKAGES)}")
             exit(1)
 
-# Check dependencies before proceeding
-check_dependencies()
+# Characters that mark an expected value as a regex pattern
+REGEX_METACHARS = frozenset('[]*?+{}')
 
-# Now we can safely import mutagen
-from mutagen.easyid3 import EasyID3
-from mutagen.wave import WAVE
-import struct
+# Matches ANSI color codes, stripped from file output
+ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
 
 # Add these color constants at the top of the file
 class Colors:
@@ -57,71 +61,93 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
-def detect_delimiter(file_path):
-    """Detect if file is CSV or TSV based on first line"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        first_line = f.readline()
-        if '\t' in first_line:
-            return '\t'
-        return ','
-
-def validate_file_structure(file_path, delimiter):
-    """Validate the file has at least 3 columns"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f, delimiter=delimiter)
-        try:
-            first_row = next(reader)
-            if len(first_row) < 3:
-                return False, "File must have at least 3 columns"
-            return True, None
-        except StopIteration:
-            return False, "File is empty"
+def make_debug_print(verbose):
+    """Return a print function that only prints in verbose mode"""
+    def debug_print(*print_args, **print_kwargs):
+        if verbose:
+            print(*print_args, **print_kwargs)
+    return debug_print
+
+# These tags are stored as TXXX frames named after the tag
+TXXX_LIKE_TAGS = {'TDRL', 'TPUB', 'MVNM', 'MVIN'}
+
+def get_tag_kind(tag):
+    """Return how a tag is looked up in an MP3 (a key of TAG_HANDLERS)"""
+    if tag in TXXX_LIKE_TAGS:
+        return 'TXXX_LIKE'
+    if tag in ('COMM', 'DESC'):
+        return tag
+    if tag.startswith('TXXX:'):
+        return 'TXXX'
+    return 'STD'
 
 def load_expected_tags(file_path, debug_print):
     """Load expected tags from CSV/TSV file"""
     try:
-        delimiter = detect_delimiter(file_path)
-        valid, error = validate_file_structure(file_path, delimiter)
-        if not valid:
-            raise ValueError(error)
+        # Read the file once; delimiter detection, validation and parsing all use this copy
+        with open(file_path, newline='', encoding='utf-8') as f:
+            data = f.read()
+
+        # Detect if file is CSV or TSV based on first line
+        delimiter = '\t' if '\t' in data.partition('\n')[0] else ','
+        if delimiter == '\t':
+            # TSV values aren't quoted, so a plain split is enough
+            reader = (line.rstrip('\r').split('\t', 3) for line in data.split('\n'))
+        else:
+            reader = csv.reader(io.StringIO(data, newline=''), delimiter=delimiter)
+
+        # Validate the file has at least 3 columns
+        first_row = next(reader, None)
+        if first_row is None:
+            raise ValueError("File is empty")
+        if len(first_row) < 3:
+            raise ValueError("File must have at least 3 columns")
 
         expected_tags = {}
-        with open(file_path, newline='', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile, delimiter=delimiter)
-            
-            for row in reader:
-                # Skip comments and empty lines
-                if not row or row[0].startswith('#'):
-                    continue
-                    
-                if len(row) >= 3:
-                    tag = row[0].strip()
-                    description = row[1].strip('() *')  # Remove parentheses, asterisks
-                    pattern = row[2].strip()
-                    
-                    # Handle special characters in pattern
-                    pattern = pattern.strip()
-                    # Replace • with comma in regex patterns
-                    if any(c in pattern for c in '[]*?+'):
-                        pattern = pattern.replace('•', ',')
-                    
-                    # Handle TXXX tags specially
-                    if tag == 'TXXX':
-                        # Get the specific TXXX tag type from description
-                        # Remove any trailing characters like ) or **
-                        txxx_type = description.rstrip(')*')
-                        tag = f'TXXX:{txxx_type}'
-                    else:
-                        # Remove ** markers from other tag names
-                        tag = tag.strip('*')
-                    
-                    debug_print(f"Debug: Reading tag: {tag} ({description}), pattern: {pattern}")
-                    expected_tags[tag] = {
-                        'description': description,
-                        'pattern': pattern,
-                        'is_regex': any(c in pattern for c in '[]*?+')
-                    }
-        
+        for row in itertools.chain([first_row], reader):
+            # Skip comments and empty lines
+            if not row or row[0].startswith('#'):
+                continue
+                
+            if len(row) >= 3:
+                tag = row[0].strip()
+                description = row[1].strip('() *')  # Remove parentheses, asterisks
+                pattern = row[2].strip()
+                
+                # Handle special characters in pattern
+                pattern = pattern.strip()
+                is_regex = not REGEX_METACHARS.isdisjoint(pattern)
+                # Replace • with comma in regex patterns
+                if is_regex:
+                    pattern = pattern.replace('•', ',')
+                
+                # Handle TXXX tags specially
+                if tag == 'TXXX':
+                    # Get the specific TXXX tag type from description
+                    # Remove any trailing characters like ) or **
+                    txxx_type = description.rstrip(')*')
+                    tag = f'TXXX:{txxx_type}'
+                else:
+                    # Remove ** markers from other tag names
+                    tag = tag.strip('*')
+                
+                debug_print(f"Debug: Reading tag: {tag} ({description}), pattern: {pattern}")
+                expected_tags[tag] = {
+                    'description': description,
+                    'pattern': pattern,
+                    'is_regex': is_regex,
+                    # Decided once here so the per-file loop doesn't re-branch on the tag name
+                    'kind': get_tag_kind(tag)
+                }
+                # Compile regex patterns once here instead of once per file
+                if is_regex:
+                    expected_tags[tag]['compiled'] = re.compile(r"\A(?:" + pattern + r")\Z")
+                # One comparison callable per tag, so checking a value doesn't branch on
+                # the tag type. Bound methods (unlike lambdas) pickle for worker processes.
+                expected_tags[tag]['match_fn'] = (
+                    expected_tags[tag]['compiled'].match if is_regex else pattern.__eq__
+                )
+    
         if not expected_tags:
             raise ValueError("No valid tags found in the file")
         return expected_tags
@@ -156,25 +182,17 @@ def get_tag_mapping():
 def get_wav_tags(wav_file):
     """Extract tags from WAV file INFO chunk"""
     tags = {}
+    source = getattr(wav_file, 'tags', None)
+    if source is None:
+        return tags
     try:
-        if hasattr(wav_file, 'tags'):
-            for key, value in wav_file.tags.items():
-                # Convert from bytes if needed
-                if isinstance(value, bytes):
-                    try:
-                        tags[key] = value.decode('utf-8')
-                    except UnicodeDecodeError:
-                        tags[key] = value.decode('latin-1')
-                else:
-                    tags[key] = str(value)
-        
-        # Try to get ID3 tags if present
-        if hasattr(wav_file, 'tags') and hasattr(wav_file.tags, '_EasyID3__id3'):
-            id3 = wav_file.tags._EasyID3__id3
-            for key in id3.keys():
-                if key not in tags:
-                    tags[key] = str(id3[key])
-        
+        # WAVE exposes its ID3 frames directly, so one pass over the items covers everything
+        for key, value in source.items():
+            # Convert from bytes if needed, replacing bad bytes like the console output does
+            if isinstance(value, (bytes, bytearray)):
+                tags[key] = value.decode('utf-8', 'replace')
+            else:
+                tags[key] = value if isinstance(value, str) else str(value)
         return tags
     except Exception as e:
         print(f"Debug: Error reading WAV tags: {str(e)}")
@@ -195,209 +213,196 @@ def get_wav_tag_mapping():
         'ITCH': 'TPE2'   # Technician (we'll use for album artist)
     }
 
-def verify_tags(file_path, expected_tags, debug_print):
+# Build the mappings and their reverse lookups once, not per file and tag
+TAG_MAPPING = get_tag_mapping()
+ID3_TO_FRIENDLY = {v: k for k, v in TAG_MAPPING.items()}
+WAV_TAG_MAPPING = get_wav_tag_mapping()
+ID3_TO_WAV = {v: k for k, v in WAV_TAG_MAPPING.items()}
+
+def normalize_txxx_desc(key):
+    """Reduce a TXXX frame key like 'TXXX:TXXX (Series)**' to its bare description ('SERIES')"""
+    desc = key.split(':', 1)[1].strip(' ()*').upper()
+    for prefix in ('TXXX ', 'TXX '):
+        if desc.startswith(prefix):
+            desc = desc[len(prefix):]
+            break
+    return desc.strip('()').strip()
+
+def get_frame_text(frame):
+    """Return the first text value of an ID3 frame, or '' if it has none"""
+    text = getattr(frame, 'text', None)
+    if not text:
+        return ''
+    value = text[0]
+    # Text frames already hold str; only timestamp frames (TDRC etc.) need converting
+    return value if isinstance(value, str) else str(value)
+
+# mutagen upgrades ID3v2.3 frames to v2.4 on load, so these are read from their v2.4 ID
+ID3_V24_RENAMES = {
+    'TYER': 'TDRC',  # Year -> recording time
+    'TORY': 'TDOR'   # Original release year -> original release time
+}
+
+def get_txxx_like_value(raw_id3, txxx_index, tag, debug_print):
+    frame = raw_id3.get(f'TXXX:{tag}')
+    return get_frame_text(frame) if frame is not None else ''
+
+def get_comm_value(raw_id3, txxx_index, tag, debug_print):
+    # Look for any COMM frame regardless of language code
+    comm_frames = raw_id3.getall('COMM')
+    if comm_frames:
+        # Use the first available COMM frame
+        actual_value = get_frame_text(comm_frames[0])
+        debug_print(f"Debug: Using {comm_frames[0].HashKey} text: {actual_value}")
+        return actual_value
+    debug_print("Debug: No COMM frames found in raw ID3 tags")
+    debug_print(f"Debug: Available raw ID3 frames: {list(raw_id3.keys())}")
+    return ''
+
+def get_desc_value(raw_id3, txxx_index, tag, debug_print):
+    # First try TXXX:DESC
+    desc_frames = raw_id3.getall('TXXX:DESC')
+    if desc_frames:
+        actual_value = get_frame_text(desc_frames[0])
+        debug_print(f"Debug: Using TXXX:DESC for description: {actual_value}")
+        return actual_value
+    debug_print("Debug: No TXXX:DESC found, checking for alternative description tags")
+    for desc, key in txxx_index.items():
+        if 'DESC' in desc:
+            actual_value = get_frame_text(raw_id3[key])
+            debug_print(f"Debug: Found alternative description in {key}: {actual_value}")
+            return actual_value
+    return ''
+
+def get_txxx_value(raw_id3, txxx_index, tag, debug_print):
+    # Get the specific part after TXXX:
+    txxx_type = tag.split(':', 1)[1].upper().strip()
+    # The index already folds 'TXXX (...)**'-style variants and case
+    key = txxx_index.get(txxx_type)
+    if key:
+        actual_value = get_frame_text(raw_id3[key])
+        debug_print(f"Debug: Found value using key {key}: {actual_value}")
+        return actual_value
+    debug_print(f"Debug: No TXXX frame found for {tag}")
+    return ''
+
+def get_standard_value(raw_id3, txxx_index, tag, debug_print):
+    frame = raw_id3.get(ID3_V24_RENAMES.get(tag, tag))
+    return get_frame_text(frame) if frame is not None else ''
+
+# How to read each kind of tag (see get_tag_kind) from an MP3's ID3 frames
+TAG_HANDLERS = {
+    'TXXX_LIKE': get_txxx_like_value,
+    'COMM': get_comm_value,
+    'DESC': get_desc_value,
+    'TXXX': get_txxx_value,
+    'STD': get_standard_value
+}
+
+def missing_results(expected_tags):
+    """Results for a file with no tags at all: every expected tag is missing"""
+    return {
+        tag: {
+            'expected': tag_info['pattern'],
+            'actual': '',
+            'match': False,
+            'is_pattern': tag_info['is_regex']
+        }
+        for tag, tag_info in expected_tags.items()
+    }
+
+def verify_tags(file_path, expected_tags, verbose=False):
+    # Takes a plain verbose flag (not a debug_print closure) so it can be
+    # pickled and run in a worker process
+    debug_print = make_debug_print(verbose)
+    # Imported here so startup (and --help) doesn't pay for loading mutagen
+    from mutagen.id3 import ID3, ID3NoHeaderError
+    from mutagen.wave import WAVE
     try:
-        tag_mapping = get_tag_mapping()
-        
-        if file_path.endswith('.mp3'):
-            audio = EasyID3(file_path)
-            raw_id3 = audio._EasyID3__id3 if hasattr(audio, '_EasyID3__id3') else None
+        if file_path.lower().endswith('.mp3'):
+            try:
+                raw_id3 = ID3(file_path)
+            except ID3NoHeaderError:
+                raw_id3 = None
+            # Untagged files (e.g. fresh rips) are missing everything, no need to check each tag
+            if not raw_id3:
+                debug_print(f"\nDebug: No ID3 tags in {os.path.basename(file_path)}")
+                return missing_results(expected_tags)
+
+            # Index the raw frames once per file instead of rescanning per tag
+            keys = list(raw_id3.keys())
+            txxx_index = {}
+            for k in keys:
+                if k.startswith('TXXX:'):
+                    desc = normalize_txxx_desc(k)
+                    # A frame whose description is already bare wins over decorated variants
+                    if desc not in txxx_index or k[5:].upper() == desc:
+                        txxx_index[desc] = k
             
             # Debug all available tags
             debug_print(f"\nDebug: Available tags in {os.path.basename(file_path)}:")
             try:
-                # First show standard tags
-                for key in audio.keys():
+                for key in keys:
                     try:
-                        value = audio[key][0] if audio[key] else ''
-                        debug_print(f"  {key}: {value}")
-                        if key in tag_mapping:
-                            debug_print(f"    (ID3: {tag_mapping[key]})")
+                        friendly_name = ID3_TO_FRIENDLY.get(key)
+                        if friendly_name:
+                            debug_print(f"  {key} ({friendly_name}): {raw_id3[key]}")
+                        else:
+                            debug_print(f"  {key}: {raw_id3[key]}")
                     except UnicodeEncodeError:
                         debug_print(f"  {key}: <contains special characters>")
-                
-                # Then explicitly check TXXX tags
-                if raw_id3:
-                    debug_print("\nDebug: Available TXXX tags:")
-                    for key in raw_id3.keys():
-                        if key.startswith('TXXX:'):
-                            try:
-                                value = str(raw_id3[key].text[0])
-                                debug_print(f"  {key}: {value}")
-                            except Exception as e:
-                                debug_print(f"  {key}: <error reading value: {e}>")
+                    except Exception as e:
+                        debug_print(f"  {key}: <error reading value: {e}>")
             except Exception as e:
                 debug_print(f"  Warning: Could not display some tags: {str(e)}")
 
             # Process MP3 tags
             results = {}
             for tag, tag_info in expected_tags.items():
-                actual_value = ''
-                
-                # Try to get the value in different ways depending on the tag type
-                if tag in ['TDRL', 'TPUB', 'MVNM', 'MVIN']:
-                    # These tags are stored as TXXX tags
-                    if raw_id3:
-                        txxx_key = f'TXXX:{tag}'
-                        if txxx_key in raw_id3:
-                            actual_value = str(raw_id3[txxx_key].text[0])
-                
-                elif tag == 'COMM':
-                    if raw_id3:
-                        # Look for any COMM frame regardless of language code
-                        comm_frames = [k for k in raw_id3.keys() if k.startswith('COMM')]
-                        if comm_frames:
-                            debug_print(f"Debug: Found raw COMM frames: {comm_frames}")
-                            # Try to get the first available COMM frame
-                            for comm_key in comm_frames:
-                                try:
-                                    frame = raw_id3[comm_key]
-                                    debug_print(f"Debug: Raw COMM frame data: {frame}")
-                                    # Access the text directly from the frame
-                                    if hasattr(frame, 'text'):
-                                        actual_value = str(frame.text[0])
-                                        debug_print(f"Debug: Using {comm_key} text: {actual_value}")
-                                        break
-                                    elif hasattr(frame, '_text'):
-                                        actual_value = str(frame._text[0])
-                                        debug_print(f"Debug: Using {comm_key} _text: {actual_value}")
-                                        break
-                                    elif hasattr(frame, 'value'):
-                                        actual_value = str(frame.value)
-                                        debug_print(f"Debug: Using {comm_key} value: {actual_value}")
-                                        break
-                                except Exception as e:
-                                    debug_print(f"Debug: Error reading COMM frame {comm_key}: {e}")
-                                    debug_print(f"Debug: Frame attributes: {dir(frame)}")
-                        else:
-                            debug_print("Debug: No COMM frames found in raw ID3 tags")
-                            debug_print(f"Debug: Available raw ID3 frames: {list(raw_id3.keys())}")
-                
-                elif tag == 'DESC':
-                    if raw_id3:
-                        # First try TXXX:DESC
-                        if 'TXXX:DESC' in raw_id3:
-                            actual_value = str(raw_id3['TXXX:DESC'].text[0])
-                            debug_print(f"Debug: Using TXXX:DESC for description: {actual_value}")
-                        # Optionally fall back to COMM if no DESC found
-                        elif not actual_value:
-                            debug_print("Debug: No TXXX:DESC found, checking for alternative description tags")
-                            for key in raw_id3.keys():
-                                if key.startswith('TXXX:') and 'DESC' in key.upper():
-                                    actual_value = str(raw_id3[key].text[0])
-                                    debug_print(f"Debug: Found alternative description in {key}: {actual_value}")
-                                    break
-                
-                elif tag.startswith('TXXX:'):
-                    if raw_id3:
-                        # Get the specific part after TXXX:
-                        txxx_type = tag.split(':', 1)[1]
-                        # Try different TXXX formats
-                        possible_keys = [
-                            f'TXXX:{txxx_type}',
-                            f'TXXX:TXXX ({txxx_type})',
-                            f'TXXX:TXX ({txxx_type})**',
-                            f'TXXX:TXXX ({txxx_type})**',
-                            # Try case-insensitive variants
-                            f'TXXX:TXXX ({txxx_type.lower()})**',
-                            f'TXXX:TXXX ({txxx_type.title()})**',
-                            f'TXXX:TXX ({txxx_type.upper()})**'
-                        ]
-                        debug_print(f"Debug: Checking TXXX keys for {tag}: {possible_keys}")
-                        for key in possible_keys:
-                            if key in raw_id3:
-                                actual_value = str(raw_id3[key].text[0])
-                                debug_print(f"Debug: Found value using key {key}: {actual_value}")
-                                break
-                            # Also try without the TXXX: prefix in the comparison
-                            stripped_key = key.replace('TXXX:', '')
-                            if stripped_key in raw_id3:
-                                actual_value = str(raw_id3[stripped_key].text[0])
-                                debug_print(f"Debug: Found value using stripped key {stripped_key}: {actual_value}")
-                                break
-                
-                else:
-                    # Standard tag handling
-                    if tag in audio:
-                        actual_value = audio[tag][0]
-                    else:
-                        # Try friendly name
-                        friendly_name = next((k for k, v in tag_mapping.items() if v == tag), None)
-                        if friendly_name and friendly_name in audio:
-                            actual_value = audio[friendly_name][0]
+                actual_value = TAG_HANDLERS[tag_info['kind']](raw_id3, txxx_index, tag, debug_print)
 
                 # Process the result
-                if actual_value:
-                    if tag_info['is_regex']:
-                        matches = re.match(f"^{tag_info['pattern']}$", actual_value)
-                        results[tag] = {
-                            'expected': tag_info['pattern'],
-                            'actual': actual_value,
-                            'match': bool(matches),
-                            'is_pattern': True
-                        }
-                    else:
-                        results[tag] = {
-                            'expected': tag_info['pattern'],
-                            'actual': actual_value,
-                            'match': actual_value == tag_info['pattern'],
-                            'is_pattern': False
-                        }
-                else:
-                    results[tag] = {
-                        'expected': tag_info['pattern'],
-                        'actual': '',
-                        'match': False,
-                        'is_pattern': tag_info['is_regex']
-                    }
+                results[tag] = {
+                    'expected': tag_info['pattern'],
+                    'actual': actual_value,
+                    'match': bool(actual_value) and bool(tag_info['match_fn'](actual_value)),
+                    'is_pattern': tag_info['is_regex']
+                }
 
             return results
 
-        elif file_path.endswith('.wav'):
+        elif file_path.lower().endswith('.wav'):
             audio = WAVE(file_path)
             wav_tags = get_wav_tags(audio)
+            if not wav_tags:
+                debug_print(f"\nDebug: No tags in {os.path.basename(file_path)}")
+                return missing_results(expected_tags)
             
             debug_print(f"\nDebug: Available tags in {os.path.basename(file_path)}:")
             for key, value in wav_tags.items():
                 try:
                     debug_print(f"  {key}: {value}")
-                    if key in wav_mapping:
-                        debug_print(f"    (ID3 equivalent: {wav_mapping[key]})")
+                    if key in WAV_TAG_MAPPING:
+                        debug_print(f"    (ID3 equivalent: {WAV_TAG_MAPPING[key]})")
                 except UnicodeEncodeError:
                     debug_print(f"  {key}: <contains special characters>")
             
             results = {}
             for tag, tag_info in expected_tags.items():
                 # Check both WAV and ID3 style tags
-                wav_key = next((k for k, v in wav_mapping.items() if v == tag), None)
+                wav_key = ID3_TO_WAV.get(tag)
                 actual_value = wav_tags.get(tag, '') or wav_tags.get(wav_key, '')
                 
-                if actual_value:
-                    if tag_info['is_regex']:
-                        matches = re.match(f"^{tag_info['pattern']}$", actual_value)
-                        results[tag] = {
-                            'expected': tag_info['pattern'],
-                            'actual': actual_value,
-                            'match': bool(matches),
-                            'is_pattern': True
-                        }
-                    else:
-                        results[tag] = {
-                            'expected': tag_info['pattern'],
-                            'actual': actual_value,
-                            'match': actual_value == tag_info['pattern'],
-                            'is_pattern': False
-                        }
-                else:
+                if not actual_value:
                     debug_print(f"Debug: Tag '{tag}' ({tag_info['description']}) not found in WAV file")
                     if wav_key:
                         debug_print(f"Debug: Also checked WAV tag '{wav_key}'")
-                    results[tag] = {
-                        'expected': tag_info['pattern'],
-                        'actual': '',
-                        'match': False,
-                        'is_pattern': tag_info['is_regex']
-                    }
+                results[tag] = {
+                    'expected': tag_info['pattern'],
+                    'actual': actual_value,
+                    'match': bool(actual_value) and bool(tag_info['match_fn'](actual_value)),
+                    'is_pattern': tag_info['is_regex']
+                }
             return results
         else:
             return {'error': "Unsupported file format"}
@@ -405,21 +410,207 @@ def verify_tags(file_path, expected_tags, debug_print):
         debug_print(f"Debug: Error processing {file_path}: {str(e)}")
         return {'error': str(e)}
 
-def process_directory(directory, expected_tags, debug_print):
-    results = {}
+AUDIO_EXTENSIONS = {'.mp3', '.wav'}
+
+def iter_audio(directory):
+    """Yield paths of audio files under directory, without following symlinks"""
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        if os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS:
+                            yield entry.path
+        except OSError:
+            # Skip unreadable directories, as os.walk did
+            continue
+
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'check-id3', 'cache.sqlite')
+# Bump this when verification logic changes so old cached results are ignored
+CACHE_VERSION = 2
+
+# Commit this often so other runs aren't blocked on one long write transaction
+CACHE_COMMIT_EVERY = 100
+
+class ResultCache:
+    """On-disk cache of verification results, keyed by absolute file path, size and mtime"""
+
+    def __init__(self, cache_path, expected_tags):
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        self.cache_path = cache_path
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS results '
+            '(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, tags_hash TEXT, json TEXT)'
+        )
+        # Results depend on the expected tags too, so a different tag file
+        # must not reuse them
+        tag_spec = sorted((tag, info['pattern'], info['is_regex']) for tag, info in expected_tags.items())
+        self.tags_hash = hashlib.sha256(json.dumps([CACHE_VERSION, tag_spec]).encode('utf-8')).hexdigest()
+        self.stats = {}
+        self.uncommitted = 0
+        self.disabled = False
+
+    def disable(self, error):
+        """Stop using the cache after a database error, so verification carries on without it"""
+        if not self.disabled:
+            print(f"Warning: Result cache disabled ({self.cache_path}): {str(error)}")
+            self.disabled = True
+            try:
+                self.conn.close()
+            except sqlite3.Error:
+                pass
+
+    def get(self, file_path):
+        """Return the cached result for an unchanged file, or None"""
+        if self.disabled:
+            return None
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        # Key on the absolute path so relative paths from different folders don't collide
+        key = os.path.abspath(file_path)
+        self.stats[file_path] = (key, st.st_size, st.st_mtime_ns)
+        try:
+            row = self.conn.execute(
+                'SELECT size, mtime_ns, tags_hash, json FROM results WHERE path = ?', (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.disable(e)
+            return None
+        if row and (row[0], row[1]) == self.stats[file_path][1:] and row[2] == self.tags_hash:
+            return json.loads(row[3])
+        return None
+
+    def put(self, file_path, result):
+        """Store a result, using the file stats seen by get()"""
+        file_stat = self.stats.pop(file_path, None)
+        # Don't cache errors, they may be transient (locked or unreadable files)
+        if self.disabled or 'error' in result or file_stat is None:
+            return
+        key, size, mtime_ns = file_stat
+        try:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO results (path, size, mtime_ns, tags_hash, json) VALUES (?, ?, ?, ?, ?)',
+                (key, size, mtime_ns, self.tags_hash, json.dumps(result))
+            )
+            self.uncommitted += 1
+            if self.uncommitted >= CACHE_COMMIT_EVERY:
+                self.conn.commit()
+                self.uncommitted = 0
+        except sqlite3.Error as e:
+            self.disable(e)
+
+    def close(self):
+        if self.disabled:
+            return
+        try:
+            self.conn.commit()
+            self.conn.close()
+        except sqlite3.Error as e:
+            self.disable(e)
+
+def open_cache(expected_tags, cache_path=CACHE_PATH):
+    """Open the result cache, or return None if it can't be used"""
+    try:
+        return ResultCache(cache_path, expected_tags)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: Result cache disabled ({cache_path}): {str(e)}")
+        return None
+
+WINDOWS_MAX_WORKERS = 61
+# Files handed to each worker process at a time
+CHUNK_SIZE = 32
+# How many files beyond those already handed to workers to prefetch
+PREFETCH_AHEAD = 32
+# ID3v2 tags live at the start of the file; this covers typical tags and cover art
+PREFETCH_BYTES = 256 * 1024
+
+def warm_file(file_path):
+    """Ask the OS to start reading the head of a file so parsing doesn't wait on I/O"""
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, PREFETCH_BYTES, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        else:
+            # No fadvise (e.g. Windows), so read the bytes to pull them into the cache
+            with open(file_path, 'rb') as f:
+                f.read(PREFETCH_BYTES)
+    except OSError:
+        pass
+
+def process_directory(directory, expected_tags, verbose=False, use_cache=False):
+    """Find audio files under directory and return an iterator of (file_path, result) pairs"""
+    mp3_paths = []
     wav_count = 0
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.wav'):
-                wav_count += 1
-            elif file.endswith('.mp3'):
-                file_path = Path(root) / file
-                result = verify_tags(str(file_path), expected_tags, debug_print)
-                results[str(file_path)] = result
-    
+    for file_path in iter_audio(directory):
+        if file_path.lower().endswith('.wav'):
+            wav_count += 1
+        else:
+            mp3_paths.append(file_path)
+
     if wav_count > 0:
         print(f"\n{wav_count} WAV files skipped (disabled)")
-    return results
+    return iter_results(mp3_paths, expected_tags, verbose, use_cache)
+
+def iter_results(mp3_paths, expected_tags, verbose=False, use_cache=False):
+    """Yield (file_path, result) for each file as it's verified, without keeping results around"""
+    cache = open_cache(expected_tags) if use_cache else None
+    try:
+        # Unchanged files come straight from the cache
+        pending = []
+        for file_path in mp3_paths:
+            result = cache.get(file_path) if cache else None
+            if result is None:
+                pending.append(file_path)
+            else:
+                yield file_path, result
+
+        # Files are independent, so verify them in parallel across all cores,
+        # while a few threads prefetch files the workers will reach soon
+        workers = os.cpu_count() or 1
+        if sys.platform == 'win32':
+            # ProcessPoolExecutor refuses more than 61 workers on Windows
+            workers = min(workers, WINDOWS_MAX_WORKERS)
+        window = CHUNK_SIZE * workers + PREFETCH_AHEAD
+        worker = partial(verify_tags, expected_tags=expected_tags, verbose=verbose)
+        with ExitStack() as stack:
+            if verbose:
+                # Debug output from worker processes would interleave with the
+                # report, so verify in this process, one file at a time
+                results_iter = map(worker, pending)
+            else:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                # Submitting the work starts the worker processes. Do that before
+                # starting the prefetch threads, so workers are forked from a
+                # single-threaded process.
+                results_iter = executor.map(worker, pending, chunksize=CHUNK_SIZE)
+            prefetcher = stack.enter_context(ThreadPoolExecutor(max_workers=4))
+            for file_path in pending[:window]:
+                prefetcher.submit(warm_file, file_path)
+            for i, (file_path, result) in enumerate(zip(pending, results_iter)):
+                if i + window < len(pending):
+                    prefetcher.submit(warm_file, pending[i + window])
+                if cache:
+                    cache.put(file_path, result)
+                yield file_path, result
+    finally:
+        if cache:
+            cache.close()
+
+    cached_count = len(mp3_paths) - len(pending)
+    if cached_count > 0:
+        print(f"\n{cached_count} unchanged files taken from cache (run without --cache to recheck)")
 
 def get_file_path(prompt):
     while True:
@@ -428,17 +619,17 @@ def get_file_path(prompt):
             return path
         print(f"Error: File '{path}' not found. Please try again.")
 
-def print_output(message, output_file=None, color=True):
-    """Print message to console and optionally to file (without color codes)"""
+# Large enough that most reports reach the output file in a few writes
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+def print_output(message, out_fh=None, color=True):
+    """Print message to console and optionally to an open file (without color codes)"""
     # Print to console with colors
     print(message)
     
-    # Print to file without color codes if output file is specified
-    if output_file:
-        # Remove color codes for file output
-        clean_message = re.sub(r'\033\[[0-9;]*m', '', message)
-        with open(output_file, 'a', encoding='utf-8') as f:
-            f.write(clean_message + '\n')
+    # Print to file without color codes if an output file handle is given
+    if out_fh:
+        out_fh.write(ANSI_RE.sub('', message) + '\n')
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Verify ID3 tags in MP3 files')
@@ -450,12 +641,18 @@ if __name__ == "__main__":
                         help='Show detailed debug output (useful if you get unexpected results)')
     parser.add_argument('-o', '--output-file', action='store_true',
                         help='Save results to a plaintext file, in the source audio folder')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse results from earlier runs for files whose size and modification '
+                             'time are unchanged (edits that keep both are not picked up)')
     args = parser.parse_args()
 
+    # Check dependencies before proceeding (set CHECK_ID3_SKIP_DEPS to skip
+    # this when they're known to be installed)
+    if not os.environ.get('CHECK_ID3_SKIP_DEPS'):
+        check_dependencies()
+
     # Create a debug print function that only prints in verbose mode
-    def debug_print(*print_args, **print_kwargs):
-        if args.verbose:
-            print(*print_args, **print_kwargs)
+    debug_print = make_debug_print(args.verbose)
 
     debug_print("\nDebug: Command line arguments received:")
     debug_print(f"  Tag file: {args.tag_file}")
@@ -468,7 +665,14 @@ if __name__ == "__main__":
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = os.path.join(args.folder, f"check-id3_results_{timestamp}.txt")
 
+    out_fh = None
     try:
+        # Open the output file once for the whole run rather than once per line,
+        # before loading the tags so errors from that still end up in the file.
+        # A missing folder is reported by the directory check below.
+        if output_file and os.path.isdir(args.folder):
+            out_fh = open(output_file, 'a', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+
         if args.tag_file:
             csv_path = args.tag_file
         else:
@@ -485,7 +689,7 @@ if __name__ == "__main__":
             exit(1)
         
         print("\nProcessing files...")
-        results = process_directory(directory, expected_tags, debug_print)
+        results = process_directory(directory, expected_tags, args.verbose, args.cache)
         
         # Initialize statistics
         stats = {
@@ -500,8 +704,9 @@ if __name__ == "__main__":
             'tags_missing': 0
         }
         
-        print_output("\nVerification Results:", output_file)
-        for file, result in results.items():
+        print_output("\nVerification Results:", out_fh)
+        # Results are streamed, so stats are tallied as each file comes in
+        for file, result in results:
             mismatches_found = False
             file_mismatches = []
             
@@ -509,8 +714,8 @@ if __name__ == "__main__":
             stats['total_files'] += 1
             
             if 'error' in result:
-                print_output(f"\nFile: {Colors.CYAN}{os.path.basename(file)}{Colors.END}", output_file)
-                print_output(f"{Colors.RED}[-]{Colors.END} Error: {result['error']}", output_file)
+                print_output(f"\nFile: {Colors.CYAN}{os.path.basename(file)}{Colors.END}", out_fh)
+                print_output(f"{Colors.RED}[-]{Colors.END} Error: {result['error']}", out_fh)
                 stats['files_with_errors'] += 1
             else:
                 file_has_missing_tags = False
@@ -542,11 +747,11 @@ if __name__ == "__main__":
                     else:
                         stats['tags_matched'] += 1
                 
-                # Only print file name and mismatches if there are any
+                # Only print file name and mismatches if there are any,
+                # as a single write per file rather than one per line
                 if mismatches_found:
-                    print_output(f"\nFile: {Colors.CYAN}{os.path.basename(file)}{Colors.END}", output_file)
-                    for mismatch in file_mismatches:
-                        print_output(mismatch, output_file)
+                    file_header = f"\nFile: {Colors.CYAN}{os.path.basename(file)}{Colors.END}"
+                    print_output('\n'.join([file_header] + file_mismatches), out_fh)
                 
                 if file_has_missing_tags:
                     stats['files_with_missing_tags'] += 1
@@ -556,23 +761,26 @@ if __name__ == "__main__":
                     stats['files_passed'] += 1
 
         # Print summary with colors
-        print_output(f"\n{Colors.BOLD}========== Summary =========={Colors.END}", output_file)
-        print_output(f"Files Processed: {Colors.CYAN}{stats['total_files']}{Colors.END}", output_file)
-        print_output(f"Files Passed: {Colors.GREEN}{stats['files_passed']}{Colors.END}", output_file)
-        print_output(f"Files with Errors: {Colors.RED}{stats['files_with_errors']}{Colors.END}", output_file)
-        print_output(f"Files with Missing Tags: {Colors.YELLOW}{stats['files_with_missing_tags']}{Colors.END}", output_file)
-        print_output(f"Files with Incorrect Tags: {Colors.RED}{stats['files_with_incorrect_tags']}{Colors.END}", output_file)
-        print_output(f"\n{Colors.BOLD}Tag Statistics:{Colors.END}", output_file)
-        print_output(f"Total Tags Checked: {Colors.CYAN}{stats['total_tags_checked']}{Colors.END}", output_file)
-        print_output(f"Tags Matched: {Colors.GREEN}{stats['tags_matched']}{Colors.END}", output_file)
-        print_output(f"Tags Mismatched: {Colors.RED}{stats['tags_mismatched']}{Colors.END}", output_file)
-        print_output(f"Tags Missing: {Colors.YELLOW}{stats['tags_missing']}{Colors.END}", output_file)
-        print_output(f"{Colors.BOLD}==========================={Colors.END}", output_file)
+        print_output(f"\n{Colors.BOLD}========== Summary =========={Colors.END}", out_fh)
+        print_output(f"Files Processed: {Colors.CYAN}{stats['total_files']}{Colors.END}", out_fh)
+        print_output(f"Files Passed: {Colors.GREEN}{stats['files_passed']}{Colors.END}", out_fh)
+        print_output(f"Files with Errors: {Colors.RED}{stats['files_with_errors']}{Colors.END}", out_fh)
+        print_output(f"Files with Missing Tags: {Colors.YELLOW}{stats['files_with_missing_tags']}{Colors.END}", out_fh)
+        print_output(f"Files with Incorrect Tags: {Colors.RED}{stats['files_with_incorrect_tags']}{Colors.END}", out_fh)
+        print_output(f"\n{Colors.BOLD}Tag Statistics:{Colors.END}", out_fh)
+        print_output(f"Total Tags Checked: {Colors.CYAN}{stats['total_tags_checked']}{Colors.END}", out_fh)
+        print_output(f"Tags Matched: {Colors.GREEN}{stats['tags_matched']}{Colors.END}", out_fh)
+        print_output(f"Tags Mismatched: {Colors.RED}{stats['tags_mismatched']}{Colors.END}", out_fh)
+        print_output(f"Tags Missing: {Colors.YELLOW}{stats['tags_missing']}{Colors.END}", out_fh)
+        print_output(f"{Colors.BOLD}==========================={Colors.END}", out_fh)
     
         if output_file:
             print(f"\nResults have been saved to: {output_file}")
     
     except Exception as e:
-        print_output(f"\nError: {str(e)}", output_file)
-        print_output("Please check your input file and try again.", output_file)
-        exit(1) 
\ No newline at end of file
+        print_output(f"\nError: {str(e)}", out_fh)
+        print_output("Please check your input file and try again.", out_fh)
+        exit(1)
+    finally:
+        if out_fh:
+            out_fh.close()